@@ -1,10 +1,39 @@
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import fields
+from operator import attrgetter
 from typing import List
 
 from manager.manage import BookManager
 from models.book import Book
 
+# Table headers and the matching `Book` attribute names
+_BOOK_HEADERS = tuple(field.name.upper() for field in fields(Book))
+_BOOK_KEYS = tuple(header.lower() for header in _BOOK_HEADERS)
+_get_book_values = attrgetter(*_BOOK_KEYS)
+
+
+def _write_output(text: str) -> None:
+    """
+    Writes text to stdout in one call.
+
+    When stdout is redirected, the text is encoded once and written
+    straight to the underlying binary buffer.
+    Terminals and streams without a buffer get a regular text write.
+
+    :param text: Text to write.
+    """
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None or stream.isatty():
+        stream.write(text)
+        return
+
+    stream.flush()
+    buffer.write(text.encode(stream.encoding or "utf-8",
+                             stream.errors or "strict"))
+    buffer.flush()
+
 
 class Command(ABC):
     """
@@ -38,43 +67,29 @@ class ShowAllCommand(Command):
         """
         self.book_manager = book_manager
 
-    def _get_book_headers(self) -> List[str]:
-        """
-        Gets a list of headers for a table from the fields of the `Book` model.
-
-        :return: List of lines with headers.
-        """
-        return [field.name.upper() for field in fields(Book)]
-
     def _print_table(self, books: List[Book]) -> None:
         """
         Displays a table of all books.
 
         :param books: List of Book objects.
         """
-        headers = self._get_book_headers()
-        column_widths = {header: len(header) for header in headers}
-        book_data = [book.to_json() for book in books]
-
-        for book in book_data:
-            for header in headers:
-                column_widths[header] = max(
-                    column_widths[header],
-                    len(str(book.get(header.lower(), "")))
-                )
-
-        # Displaying table headers
-        header_row = " | ".join(
-            header.ljust(column_widths[header]) for header in headers)
-        print(header_row)
-        print("-" * len(header_row))
-
-        # Output of book data
-        for book in book_data:
-            row = " | ".join(
-                str(book.get(header.lower(), "")).ljust(
-                    column_widths[header]) for header in headers)
-            print(row)
+        book_data = [tuple(map(str, _get_book_values(book)))
+                     for book in books]
+        # `max`/`map`/`len` reduce each column in C, no per-cell bytecode
+        column_widths = [
+            max(map(len, column))
+            for column in zip(_BOOK_HEADERS, *book_data)
+        ]
+
+        # One format spec pads a whole row in a single call
+        row_format = " | ".join(f"{{:<{width}}}" for width in column_widths)
+
+        # Table headers followed by the book data
+        header_row = row_format.format(*_BOOK_HEADERS)
+        rows = [header_row, "-" * len(header_row)]
+        rows.extend(row_format.format(*book) for book in book_data)
+
+        _write_output("\n".join(rows) + "\n")
 
     def execute(self, args):
         """
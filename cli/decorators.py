@@ -1,7 +1,37 @@
+import atexit
 import os
-import readline
+import sys
+from collections import deque
 from typing import Callable
 
+# Below this size the history file is handed to readline as is
+_SMALL_HISTORY_SIZE = 8 * 1024
+
+
+def _load_history(file: str, length: int) -> None:
+    """
+    Loads at most `length` of the latest entries from the history file.
+
+    Large files are read line by line keeping only the tail,
+    so startup cost does not grow with the size of the file.
+    The editline backend uses its own file format,
+    so it always reads the file through readline.
+
+    :param file: Path to the history file.
+    :param length: The maximum number of entries to load.
+    """
+    import readline
+
+    if (os.path.getsize(file) < _SMALL_HISTORY_SIZE
+            or "libedit" in (readline.__doc__ or "")):
+        readline.read_history_file(file)
+        return
+
+    with open(file, "rb") as history:
+        entries = deque(history, maxlen=length)
+    for entry in entries:
+        readline.add_history(entry.rstrip(b"\n").decode("utf-8", "replace"))
+
 
 def manage_history(file: str = ".library_cli_history", length: int = 100):
     """
@@ -10,6 +40,10 @@ def manage_history(file: str = ".library_cli_history", length: int = 100):
 
     This decorator allows you to save and load command history from a file,
     and also set the length of the story.
+    The history is loaded once when the decorator is applied
+    and written back when the process exits.
+    `readline` is imported only when the input comes from a terminal,
+    otherwise the function is returned as is.
 
     :param file: Path to the file where the command history will be saved.
     The default is `.library_cli_history`.
@@ -18,40 +52,45 @@ def manage_history(file: str = ".library_cli_history", length: int = 100):
     :raises Exception: Possible other errors when reading or writing to the history file.
     """
 
+    def save_history():
+        """
+        Writes the command history to the file.
+        """
+        import readline
+
+        try:
+            readline.write_history_file(file)
+        except Exception as e:
+            print(f"Error writing history file: {e}")
+
     def decorator(func: Callable):
         """
         A decorator that adds history control to a command line function.
 
         :param func: A function that will be wrapped by a decorator.
-        :return: Wrapped function with functionality for loading and saving command history.
+        :return: The original function; history is handled at decoration
+                 time and on process exit.
         """
+        if not sys.stdin.isatty():
+            return func
+
+        import readline
+
+        try:
+            # Load command history from a file, if the file exists
+            if os.path.exists(file):
+                _load_history(file, length)
+        except FileNotFoundError:
+            # If the file is not found, ignore the error
+            print(
+                f"Warning: History file '{file}' not found. "
+                f"Creating a new one.")
+        except Exception as e:
+            print(f"Error reading history file: {e}")
+
+        readline.set_history_length(length)
+        atexit.register(save_history)
 
-        def wrapper(*args, **kwargs):
-            try:
-                # Load command history from a file, if the file exists
-                if os.path.exists(file):
-                    readline.read_history_file(file)
-            except FileNotFoundError:
-                # If the file is not found, ignore the error
-                print(
-                    f"Warning: History file '{file}' not found. "
-                    f"Creating a new one.")
-            except Exception as e:
-                print(f"Error reading history file: {e}")
-
-            readline.set_history_length(length)
-
-            try:
-                # Execute the original function
-                result = func(*args, **kwargs)
-            finally:
-                try:
-                    readline.write_history_file(file)
-                except Exception as e:
-                    print(f"Error writing history file: {e}")
-
-            return result
-
-        return wrapper
+        return func
 
     return decorator
@@ -1,11 +1,11 @@
-import argparse
-import shlex
+from functools import cached_property
+from types import SimpleNamespace
 
 from cli.commands import (AddBookCommand, UpdateStatusCommand,
                           RemoveBookCommand,
                           ShowAllCommand, ShowFilteredBooksCommand)
 from manager.manage import BookManager
-from models.constants import BookStatus
+from models.constants import STATUS_VALUES, BookStatus
 
 
 class CLIParser:
@@ -16,15 +16,43 @@ class CLIParser:
         :param book_manager: A BookManager instance for managing books.
         """
         self.book_manager = book_manager
-        self.parser = argparse.ArgumentParser(
-            description="Library Manager CLI")
-        self.subparsers = self.parser.add_subparsers(dest="command")
+        self._command_map = {
+            "add-book": AddBookCommand(book_manager),
+            "show-all": ShowAllCommand(book_manager),
+            "update-status": UpdateStatusCommand(book_manager),
+            "remove-book": RemoveBookCommand(book_manager),
+            "find-books": ShowFilteredBooksCommand(book_manager),
+        }
+        # Commands with plain string arguments that skip argparse:
+        # name -> names of the positional arguments
+        self._fast_commands = {
+            "show-all": (),
+            "update-status": ("book_id", "status"),
+            "remove-book": ("book_id",),
+            "find-books": ("query",),
+        }
+
+    @cached_property
+    def parser(self):
+        """
+        The argparse parser with all commands, built on first use.
+
+        Commands handled without argparse never need it,
+        so for them argparse is not even imported.
+
+        :return: The argument parser.
+        """
+        import argparse
+
+        parser = argparse.ArgumentParser(description="Library Manager CLI")
+        self.subparsers = parser.add_subparsers(dest="command")
 
         self._add_add_book_command()
         self._add_show_all_command()
         self._add_update_status_command()
         self._add_remove_book_command()
         self._add_find_books_command()
+        return parser
 
     def _add_add_book_command(self):
         """Adds a command to add a book."""
@@ -75,27 +103,57 @@ class CLIParser:
 
         :param command_input: Command input string.
         """
-        args = self._parse_command(command_input)
+        import shlex
+
+        tokens = shlex.split(command_input)
+        args = self._parse_fast_command(tokens)
+        if args is None:
+            args = self._parse_command(tokens)
         if args is None or not args.command:
             print("No command provided. Use 'help' for a list of commands.")
             return
 
         command = self._get_command(args.command)
         if command:
-            self._execute_command(command, args)
+            command.execute(args)
         else:
             print(f"Unknown command: {args.command}. "
                   f"Use 'help' for a list of commands.")
 
-    def _parse_command(self, command_input: str):
+    def _parse_fast_command(self, tokens: list):
+        """
+        Builds arguments for simple commands without going through argparse.
+
+        Anything unusual (unknown command, wrong number of arguments,
+        options, invalid status) is left to argparse,
+        so that it reports the error.
+
+        :param tokens: Command tokens.
+        :return: Object with arguments, or None if argparse is needed.
+        """
+        if not tokens:
+            return None
+        names = self._fast_commands.get(tokens[0])
+        values = tokens[1:]
+        if (names is None or len(values) != len(names)
+                or any(value.startswith("-") for value in values)):
+            return None
+
+        args = SimpleNamespace(command=tokens[0], **dict(zip(names, values)))
+        if (args.command == "update-status"
+                and args.status not in STATUS_VALUES):
+            return None
+        return args
+
+    def _parse_command(self, tokens: list):
         """
         Parses a command and returns arguments.
 
-        :param command_input: Command string for parsing.
+        :param tokens: Command tokens for parsing.
         :return: Object with arguments, or None on error.
         """
         try:
-            return self.parser.parse_args(shlex.split(command_input))
+            return self.parser.parse_args(tokens)
         except SystemExit:
             return None
 
@@ -106,15 +164,4 @@ class CLIParser:
         :param command_name: Command name.
         :return: Command object or None.
         """
-        command_map = {
-            "add-book": AddBookCommand(self.book_manager),
-            "show-all": ShowAllCommand(self.book_manager),
-            "update-status": UpdateStatusCommand(self.book_manager),
-            "remove-book": RemoveBookCommand(self.book_manager),
-            "find-books": ShowFilteredBooksCommand(self.book_manager),
-        }
-        return command_map.get(command_name)
-
-    def _execute_command(self, command, args):
-        """Executes a command."""
-        command.execute(args)
+        return self._command_map.get(command_name)
@@ -1,11 +1,50 @@
+import sys
+
 from cli.decorators import manage_history
 from cli.parser import CLIParser
 from manager.manage import BookManager
 from storage.json.manager import BookStorageManager
 from storage.json.source import JsonSource
 
+# Inputs that end the interactive session
+EXIT_COMMANDS = {"exit", "quit"}
+
+
+def interactive(cli: CLIParser):
+    """
+    Runs the interactive CLI menu until the user exits.
+
+    :param cli: The CLI parser used to execute the entered commands.
+    """
+    print("Welcome to the Library Manager CLI!")
+    print("You can manage your library by typing commands.")
+    print("Type 'exit' to quit the program.")
+
+    while True:
+        try:
+            # Prompt for a command from the user
+            command_input = input("> ").strip()
+
+            # Skipping empty input
+            if not command_input:
+                continue
+
+            # Processing the exit command
+            if command_input.lower() in EXIT_COMMANDS:
+                print("Exiting program...")
+                break
+
+            # Executing the entered command
+            cli.execute_command(command_input)
+        except KeyboardInterrupt:
+            # Handling a program interrupt from the keyboard
+            print("\nUse 'exit' to quit the program.")
+        except EOFError:
+            # Error handling when input is complete
+            print("\nExiting program...")
+            break
+
 
-@manage_history()
 def main():
     """
     The main function for launching the CLI application that manages the library.
@@ -30,34 +69,12 @@ def main():
     cli = CLIParser(book_manager)
 
     # Проверка наличия аргументов командной строки
-    import sys
     if len(sys.argv) > 1:
         cli.execute_command(" ".join(sys.argv[1:]))
     else:
-        # If there are no arguments, launch the interactive menu
-        print("Welcome to the Library Manager CLI!")
-        print("You can manage your library by typing commands.")
-        print("Type 'exit' to quit the program.")
-
-        while True:
-            try:
-                # Prompt for a command from the user
-                command_input = input("> ")
-
-                # Processing the exit command
-                if command_input.lower() == "exit":
-                    print("Exiting program...")
-                    break
-
-                # Executing the entered command
-                cli.execute_command(command_input)
-            except KeyboardInterrupt:
-                # Handling a program interrupt from the keyboard
-                print("\nUse 'exit' to quit the program.")
-            except EOFError:
-                # Error handling when input is complete
-                print("\nExiting program...")
-                break
+        # If there are no arguments, launch the interactive menu.
+        # Command history is only needed here, so it is set up lazily
+        manage_history()(interactive)(cli)
 
 
 if __name__ == "__main__":
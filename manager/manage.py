@@ -1,7 +1,7 @@
 from typing import List, Optional
 
 from models.book import Book
-from models.constants import BookStatus
+from models.constants import STATUS_VALUES
 from models.exceptions import ValidationException, BookNotFoundException
 from storage.json.manager import BookStorageManager
 
@@ -68,7 +68,7 @@ class BookManager:
         if not book:
             raise BookNotFoundException(f"Book with ID {book_id} not found")
 
-        if status not in BookStatus:
+        if status not in STATUS_VALUES:
             raise ValidationException(f"Invalid status: {status}")
 
         book.status = status
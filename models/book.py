@@ -1,13 +1,12 @@
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Dict
 
 from models.constants import BookStatus
 from models.exceptions import ValidationException
 from models.utils import generate_unique_id
-from models.validators.book import BookValidator
 
 
-@dataclass
+@dataclass(slots=True)
 class Book:
     """
     Book model class.
@@ -27,10 +26,9 @@ class Book:
         """
         Initializing a book instance.
 
-        If the object does not contain an ID, a unique identifier is generated.
+        The ID is not an init argument, so a unique identifier is generated.
         """
-        if not hasattr(self, 'id') or not self.id:
-            self.id = generate_unique_id()
+        self.id = generate_unique_id()
 
     def to_dict(self) -> dict:
         """
@@ -38,7 +36,23 @@ class Book:
 
         :return: A dict containing the book data.
         """
-        return asdict(self)
+        return {
+            "id": self.id,
+            "title": self.title,
+            "author": self.author,
+            "year": self.year,
+            "status": self.status,
+        }
+
+    def as_tuple(self) -> tuple:
+        """
+        Returns the book data without the ID as a tuple.
+
+        Handy for comparing books created independently of each other.
+
+        :return: A tuple of title, author, year and status.
+        """
+        return self.title, self.author, self.year, self.status
 
     def to_json(self) -> dict:
         """
@@ -47,9 +61,7 @@ class Book:
         :return: A dict with book data,
                  including a string representation of the status.
         """
-        book_data = self.to_dict()
-        book_data['status'] = self.status
-        return book_data
+        return self.to_dict()
 
     @classmethod
     def from_json(cls, data: Dict) -> "Book":
@@ -77,7 +89,8 @@ class Book:
                   otherwise throws an exception.
         :raises ValidationException: If the book data is invalid.
         """
-        validator = BookValidator()
+        from models.validators.book import BOOK_VALIDATOR as validator
+
         try:
             validator.validate_data(self.to_dict())
             return True
@@ -12,11 +12,18 @@ class BookStatus(Enum):
     AVAILABLE = "в наличии"
     ISSUED = "выдана"
 
-    @staticmethod
-    def get_status_choices():
+    @classmethod
+    def get_status_choices(cls):
         """
-        Returns a list of all possible status values.
+        Returns all possible status values.
 
-        :return: List of strings with possible statuses.
+        :return: Tuple of strings with possible statuses.
         """
-        return [status.value for status in BookStatus]
+        return _STATUS_CHOICES
+
+
+# Status values are fixed, so they are computed once for choices and lookups
+_STATUS_CHOICES = tuple(status.value for status in BookStatus)
+
+# All valid status values, for fast membership checks
+STATUS_VALUES = frozenset(_STATUS_CHOICES)
@@ -1,10 +1,18 @@
-import uuid
+import os
 
 
 def generate_unique_id() -> str:
     """
     Generates a unique identifier.
 
+    The identifier is a random (version 4) UUID string built directly
+    from `os.urandom`, without constructing a `uuid.UUID` object.
+
     :return: A string representing a unique identifier.
     """
-    return str(uuid.uuid4())
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    value = raw.hex()
+    return (f"{value[:8]}-{value[8:12]}-{value[12:16]}-"
+            f"{value[16:20]}-{value[20:]}")
@@ -1,5 +1,5 @@
 from dataclasses import fields
-from typing import Dict, Type
+from typing import Dict, Type, get_type_hints
 
 from models.exceptions import ValidationException
 
@@ -21,6 +21,23 @@ class Validator:
         """
         self.model_class = model_class
 
+        # The model fields do not change, so they are inspected only once
+        self._fields = fields(model_class)
+        self._required_fields = tuple(
+            f.name for f in self._fields
+            if f.init and f.default is f.default_factory
+        )
+        # Resolved types also cover annotations stored as strings
+        hints = get_type_hints(model_class)
+        self._typed_fields = tuple(
+            (f.name, hints[f.name], hints[f.name].__name__)
+            for f in self._fields
+        )
+        self._string_fields = tuple(
+            name for name, field_type, _ in self._typed_fields
+            if field_type is str
+        )
+
     def validate_data(self, data: Dict) -> None:
         """
         Checks data for compliance with all validation rules.
@@ -30,11 +47,13 @@ class Validator:
                      and the values are the corresponding values.
         :raises ValidationException: If the data is not validated.
         """
-        errors = []
-        errors.extend(self._check_required_fields(data))
-        errors.extend(self._check_data_types(data))
-        errors.extend(self._check_empty_fields(data))
+        # Other checks are pointless while required fields are missing
+        errors = self._check_required_fields(data)
+        if errors:
+            raise ValidationException("; ".join(errors))
 
+        errors = self._check_data_types(data)
+        errors.extend(self._check_empty_fields(data))
         if errors:
             raise ValidationException("; ".join(errors))
 
@@ -45,9 +64,7 @@ class Validator:
         :param data: Model data.
         :return: List of errors if any required fields are missing.
         """
-        required_fields = [f.name for f in fields(self.model_class) if
-                           f.init and f.default is f.default_factory]
-        missing_fields = [f for f in required_fields if f not in data]
+        missing_fields = [f for f in self._required_fields if f not in data]
 
         if missing_fields:
             return [f"Missing required fields: {', '.join(missing_fields)}"]
@@ -61,14 +78,11 @@ class Validator:
         :return: List of errors if the data type is not as expected.
         """
         errors = []
-        for field_info in fields(self.model_class):
-            field_name = field_info.name
+        for field_name, expected_type, type_name in self._typed_fields:
             if field_name in data:
-                expected_type = field_info.type
                 if not isinstance(data[field_name], expected_type):
                     errors.append(
-                        f"Field '{field_name}' must be of "
-                        f"type {expected_type.__name__}")
+                        f"Field '{field_name}' must be of type {type_name}")
         return errors
 
     def _check_empty_fields(self, data: Dict) -> list:
@@ -79,9 +93,7 @@ class Validator:
         :return: Список ошибок, если строковые поля пусты.
         """
         errors = []
-        string_fields = [f.name for f in fields(self.model_class)
-                         if f.type is str]
-        empty_fields = [field for field in string_fields
+        empty_fields = [field for field in self._string_fields
                         if not data.get(field, "").strip()]
         if empty_fields:
             errors.append(f"Fields cannot be empty: {', '.join(empty_fields)}")
@@ -1,7 +1,8 @@
+import time
 from datetime import datetime
 from typing import Dict
 
-from models.constants import BookStatus
+from models.constants import STATUS_VALUES, BookStatus
 from models.exceptions import ValidationException
 from models.validators.base import Validator
 
@@ -21,6 +22,7 @@ class BookValidator(Validator):
         from models.book import Book
 
         super().__init__(Book)
+        self._update_current_year()
 
     def validate_data(self, data: Dict) -> None:
         """
@@ -44,9 +46,9 @@ class BookValidator(Validator):
         :param data: Book data.
         :return: List of errors if the book status is invalid.
         """
-        if data.get("status") not in [status.value for status in BookStatus]:
+        if data.get("status") not in STATUS_VALUES:
             return [f"Incorrect status: {data.get('status')}. "
-                    f"Valid values: {[s.value for s in BookStatus]}"]
+                    f"Valid values: {list(BookStatus.get_status_choices())}"]
         return []
 
     def _check_year(self, data: Dict) -> list:
@@ -60,8 +62,30 @@ class BookValidator(Validator):
         if year is None:
             return ["Year is required."]
 
-        current_year = datetime.now().year
+        current_year = self._get_current_year()
 
         if not (1 <= year <= current_year):
             return [f"Year must be between 1 and {current_year}."]
         return []
+
+    def _update_current_year(self) -> None:
+        """
+        Remembers the current year and the moment when it ends.
+        """
+        self._current_year = datetime.now().year
+        self._year_ends_at = datetime(self._current_year + 1, 1, 1).timestamp()
+
+    def _get_current_year(self) -> int:
+        """
+        Returns the cached current year,
+        refreshing it only after the year is over.
+
+        :return: The current year.
+        """
+        if time.time() >= self._year_ends_at:
+            self._update_current_year()
+        return self._current_year
+
+
+# Shared validator instance, its field tables are built only once
+BOOK_VALIDATOR = BookValidator()
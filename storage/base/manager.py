@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from models.book import Book
 
@@ -23,6 +23,17 @@ class StorageManager(ABC):
         """
         pass
 
+    def save_many(self, books: Iterable[Book]) -> None:
+        """
+        Saves several books to the storage.
+
+        Implementations may override it to save all books at once.
+
+        :param books: The Book objects to save.
+        """
+        for book in books:
+            self.save(book)
+
     @abstractmethod
     def get(self, book_id: str) -> Optional[Book]:
         """
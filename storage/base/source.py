@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generator
+from typing import Any, Dict, Generator, Iterable
 
 
 class DataSource(ABC):
@@ -23,12 +23,12 @@ class DataSource(ABC):
         pass
 
     @abstractmethod
-    def save(self, data: list[Dict]) -> None:
+    def save(self, data: Iterable[Dict]) -> None:
         """
         Saves data to the source.
 
         This method should be implemented to write data to a specific source.
 
-        :param data: A list of dictionaries representing the data to save.
+        :param data: An iterable of dictionaries representing the data to save.
         """
         pass
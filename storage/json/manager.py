@@ -1,10 +1,40 @@
-from typing import Dict, List, Optional
+from contextlib import contextmanager
+from dataclasses import fields
+from operator import attrgetter
+from typing import (Dict, Iterable, Iterator, List, Optional, Set, Tuple,
+                    Union)
 
 from models.book import Book
 from storage.base.manager import StorageManager
-from storage.base.observer import ObservableList
 from storage.base.source import DataSource
 
+# Length of the substrings in the search index
+TRIGRAM_SIZE = 3
+
+# Fields searched by substring, the year is matched exactly
+TEXT_FIELDS = ("title", "author")
+
+# Longer digit queries are never looked up as a year,
+# and int() refuses to convert very long ones
+_MAX_YEAR_DIGITS = 19
+
+# Reads all stored fields of a book as a tuple
+_get_book_state = attrgetter(*(field.name for field in fields(Book)))
+
+
+def _index_keys(book: Book) -> Tuple[Tuple[str, Union[str, int]], ...]:
+    """
+    Get the (field, value) pairs under which a book is indexed.
+
+    :param book: The book object to index.
+    :return: Lowercase title and author, and the year.
+    """
+    return (
+        ("title", book.title.lower()),
+        ("author", book.author.lower()),
+        ("year", book.year),
+    )
+
 
 class BookStorageManager(StorageManager):
     """
@@ -23,10 +53,14 @@ class BookStorageManager(StorageManager):
         :param data_source: The data source used to load and save books.
         """
         self.data_source = data_source
-        self.__books = ObservableList(
-            list(self._load_objs()), on_change=self._on_change
-        )
-        self.__index = self._create_index(self.__books)
+        # Nesting depth of `batch()` and whether changes await a flush
+        self._batching = 0
+        self._dirty = False
+        self.__books: List[Book] = self._load_objs()
+        self.__id_index = self._create_id_index(self.__books)
+        self._create_indexes()
+        # State of the books as last loaded or written
+        self._saved_state = self._get_state()
 
     def _load_objs(self) -> List[Book]:
         """
@@ -40,9 +74,25 @@ class BookStorageManager(StorageManager):
         """
         Saves the books to the data source.
 
+        Nothing is written if the books have not changed since the last save,
+        e.g. when a book is saved again with the same data.
+
         :return: None
         """
-        self.data_source.save([book.to_json() for book in self.__books])
+        state = self._get_state()
+        if state == self._saved_state:
+            return
+
+        self.data_source.save(book.to_json() for book in self.__books)
+        self._saved_state = state
+
+    def _get_state(self) -> Tuple[tuple, ...]:
+        """
+        Takes a snapshot of the field values of all books.
+
+        :return: A tuple with the field values of each book.
+        """
+        return tuple(map(_get_book_state, self.__books))
 
     def save(self, book: Book) -> None:
         """
@@ -50,16 +100,26 @@ class BookStorageManager(StorageManager):
 
         :param book: Book object to save.
         """
-        found = False
         # Update a Book if it already exists
-        for i, b in enumerate(self.__books):
-            if b.id == book.id:
-                self.__books[i] = book
-                found = True
-                break
-
-        if not found:
+        i = self.__id_index.get(book.id)
+        self._remove_from_index(book.id)
+        self._add_to_index(book)
+        if i is not None:
+            self.__books[i] = book
+        else:
+            self.__id_index[book.id] = len(self.__books)
             self.__books.append(book)
+        self._persist()
+
+    def save_many(self, books: Iterable[Book]) -> None:
+        """
+        Save or update several books with a single write.
+
+        :param books: Book objects to save.
+        """
+        with self.batch():
+            for book in books:
+                self.save(book)
 
     def get(self, book_id: str) -> Optional[Book]:
         """
@@ -68,10 +128,8 @@ class BookStorageManager(StorageManager):
         :param book_id: Unique identifier of the book.
         :return: Found book object or None.
         """
-        for book in self.__books:
-            if book.id == book_id:
-                return book
-        return None
+        i = self.__id_index.get(book_id)
+        return self.__books[i] if i is not None else None
 
     def delete(self, book: Book) -> None:
         """
@@ -79,7 +137,10 @@ class BookStorageManager(StorageManager):
 
         :param book: The book object to delete.
         """
-        self.__books.remove(book)
+        self._remove_from_index(book.id)
+        del self.__books[self.__id_index[book.id]]
+        self.__id_index = self._create_id_index(self.__books)
+        self._persist()
 
     def find(self, query: Optional[str]) -> List[Book]:
         """
@@ -92,63 +153,202 @@ class BookStorageManager(StorageManager):
             query = query.lower()
             result_ids = set()
 
-            # Search by fields: title, author, year
-            for field in ['title', 'author', 'year']:
-                for value in self.__index[field].keys():
-                    if query in value:
-                        result_ids.update(self.__index[field][value])
+            # Substring search by title and author
+            for field, value in self._match_values(query):
+                result_ids.update(self.__index[field][value])
 
-            return [book for book in self.__books if book.id in result_ids]
+            # A number is also looked up as the exact year of publication
+            if (query.isascii() and query.isdigit()
+                    and len(query) <= _MAX_YEAR_DIGITS):
+                result_ids.update(self.__index["year"].get(int(query), ()))
 
-        return self.__books
+            # Gather only the matches, keeping the storage order
+            positions = sorted(self.__id_index[book_id]
+                               for book_id in result_ids)
+            return [self.__books[i] for i in positions]
+
+        return self.all()
 
     def all(self) -> List[Book]:
         """
         Get a list of all books.
 
+        A copy is returned, so changing it does not affect the storage.
+
         :return: List of book objects.
         """
-        return self.__books
+        return list(self.__books)
 
-    def _create_index(self, books: List[Book]) -> Dict[str, Dict[str, set]]:
+    def _match_values(self, query: str) -> Set[Tuple[str, str]]:
         """
-        Create an index to quickly search books by field.
+        Find indexed titles and authors that contain the query.
 
-        :param books: List of book objects.
-        :return: A dictionary containing an index of books by field.
+        Queries of three or more characters only check the values
+        that share all of the query's trigrams;
+        shorter ones scan every indexed title and author.
+
+        :param query: Lowercase search string.
+        :return: A set of (field, value) pairs whose value contains the query.
         """
-        index = {
-            "title": {},
-            "author": {},
-            "year": {}
+        if len(query) < TRIGRAM_SIZE:
+            return {(field, value) for field in TEXT_FIELDS
+                    for value in self.__index[field] if query in value}
+
+        postings = []
+        for i in range(len(query) - TRIGRAM_SIZE + 1):
+            posting = self.__trigram_index.get(query[i:i + TRIGRAM_SIZE])
+            if not posting:
+                return set()
+            postings.append(posting)
+
+        candidates = set.intersection(*postings)
+        return {(field, value) for field, value in candidates
+                if query in value}
+
+    def _create_indexes(self) -> None:
+        """
+        Build the search indexes from scratch for all books.
+
+        :return: None
+        """
+        titles, authors, years = {}, {}, {}
+        index_keys = {}
+
+        # One tight pass over the books, trigrams are added per unique value
+        for book in self.__books:
+            keys = index_keys[book.id] = _index_keys(book)
+            (_, title), (_, author), (_, year) = keys
+            titles.setdefault(title, set()).add(book.id)
+            authors.setdefault(author, set()).add(book.id)
+            years.setdefault(year, set()).add(book.id)
+
+        # Titles and authors are lowercase strings, years are integers
+        self.__index: Dict[str, Dict[Union[str, int], Set[str]]] = {
+            "title": titles,
+            "author": authors,
+            "year": years
         }
+        self.__trigram_index: Dict[str, Set[Tuple[str, str]]] = {}
+        # Indexed (field, value) pairs of each book, to remove them later
+        self.__index_keys: Dict[str, Tuple[tuple, ...]] = index_keys
+
+        for field in TEXT_FIELDS:
+            for value in self.__index[field]:
+                self._add_trigrams(field, value)
+
+    def _add_to_index(self, book: Book) -> None:
+        """
+        Add a book to the search indexes.
 
-        def add_to_index(field: str, value: str, book_id: str) -> None:
-            """
-            Add a value to the index.
+        :param book: The book object to index.
+        :return: None
+        """
+        keys = self.__index_keys[book.id] = _index_keys(book)
 
-            :param field: Field for indexing (title, author, year).
-            :param value: Value to index.
-            :param book_id: Unique identifier of the book.
-            """
-            value = value.lower()
-            if value not in index[field]:
-                index[field][value] = set()
-            index[field][value].add(book_id)
+        for field, value in keys:
+            book_ids = self.__index[field].get(value)
+            if book_ids is None:
+                book_ids = self.__index[field][value] = set()
+                if field in TEXT_FIELDS:
+                    self._add_trigrams(field, value)
+            book_ids.add(book.id)
+
+    def _remove_from_index(self, book_id: str) -> None:
+        """
+        Remove a book from the search indexes.
 
-        # Indexing books by field
-        for book in books:
-            add_to_index("title", book.title, book.id)
-            add_to_index("author", book.author, book.id)
-            add_to_index("year", str(book.year), book.id)
+        Values that no longer belong to any book are dropped
+        together with their trigrams.
+
+        :param book_id: Unique identifier of the book.
+        :return: None
+        """
+        for field, value in self.__index_keys.pop(book_id, ()):
+            book_ids = self.__index[field][value]
+            book_ids.discard(book_id)
+            if book_ids:
+                continue
 
-        return index
+            del self.__index[field][value]
+            if field in TEXT_FIELDS:
+                self._remove_trigrams(field, value)
 
-    def _on_change(self) -> None:
+    def _add_trigrams(self, field: str, value: str) -> None:
         """
-        Update the index and save books to a file when data changes.
+        Add a newly indexed value to the trigram index.
 
+        :param field: Field of the value (title or author).
+        :param value: Lowercase indexed value.
         :return: None
         """
-        self.__index = self._create_index(self.__books)
+        key = (field, value)
+        trigram_index = self.__trigram_index
+        for trigram in self._trigrams(value):
+            trigram_index.setdefault(trigram, set()).add(key)
+
+    def _remove_trigrams(self, field: str, value: str) -> None:
+        """
+        Remove a value that is no longer indexed from the trigram index.
+
+        :param field: Field of the value (title or author).
+        :param value: Lowercase indexed value.
+        :return: None
+        """
+        for trigram in self._trigrams(value):
+            posting = self.__trigram_index[trigram]
+            posting.discard((field, value))
+            if not posting:
+                del self.__trigram_index[trigram]
+
+    @staticmethod
+    def _trigrams(value: str) -> Set[str]:
+        """
+        Split a value into its trigrams.
+
+        :param value: Indexed value.
+        :return: A set of substrings of length `TRIGRAM_SIZE`.
+        """
+        return {value[i:i + TRIGRAM_SIZE]
+                for i in range(len(value) - TRIGRAM_SIZE + 1)}
+
+    def _create_id_index(self, books: List[Book]) -> Dict[str, int]:
+        """
+        Create a mapping of book IDs to their positions in the list.
+
+        :param books: List of book objects.
+        :return: A dictionary mapping each book ID to its list index.
+        """
+        return {book.id: i for i, book in enumerate(books)}
+
+    @contextmanager
+    def batch(self) -> Iterator["BookStorageManager"]:
+        """
+        Group several changes into a single save.
+
+        The file is only written when the outermost block exits.
+
+        :return: A context manager yielding the storage itself.
+        """
+        self._batching += 1
+        try:
+            yield self
+        finally:
+            self._batching -= 1
+            if not self._batching and self._dirty:
+                self._persist()
+
+    def _persist(self) -> None:
+        """
+        Save books to a file after a change.
+
+        The indexes are kept up to date by `save` and `delete` themselves.
+        While a batch is active the save is postponed until it ends.
+
+        :return: None
+        """
+        if self._batching:
+            self._dirty = True
+            return
+
+        self._dirty = False
         self._save_objs()
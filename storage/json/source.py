@@ -1,10 +1,62 @@
 import json
+import mmap
 import os
-from typing import Dict, Generator, Any, List
+import stat
+import tempfile
+from typing import BinaryIO, Dict, Generator, Any, Iterable
 
 from storage.json.exceptions import InvalidJsonFormatException
 from storage.base.source import DataSource
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Files of this size and larger are memory-mapped when parsed by `orjson`
+MMAP_THRESHOLD = 1024 * 1024
+
+# Files of this size and larger are parsed incrementally with `ijson`
+STREAMING_THRESHOLD = 16 * 1024 * 1024
+
+# Buffer size for writing the JSON file
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def _loads(data: bytes) -> Any:
+    """
+    Parses JSON, using `orjson` when it is installed.
+
+    :param data: JSON document as bytes.
+    :return: The parsed object.
+    :raises json.JSONDecodeError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    Serializes data to UTF-8 JSON, using `orjson` when it is installed.
+
+    :param data: The object to serialize.
+    :param indent: Whether to indent the output with two spaces.
+    :return: JSON document as bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(
+        data, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
 
 class JsonSource(DataSource):
     """
@@ -15,39 +67,140 @@ class JsonSource(DataSource):
     to a JSON file, ensuring the file exists and creating an empty one if it does not.
     """
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, pretty: bool = False):
+        """
+        Initializes the JSON data source.
+
+        :param file_path: Path to the JSON file.
+        :param pretty: Whether to write indented JSON.
+                       Compact JSON is written record by record
+                       and is faster to produce.
+        """
         self.file_path = file_path
+        self.pretty = pretty
         self._ensure_file_exists()
 
     def load(self) -> Generator[Dict, Any, None]:
         """
         Loads data from a JSON file as a generator.
 
+        Large files are streamed item by item when `ijson` is installed,
+        so the whole array is never held in memory at once.
+        Medium-sized files are memory-mapped and parsed by `orjson`
+        without copying them into a Python object first.
+
         :return: A generator that yields data as dictionaries.
         :raises InvalidJsonFormatException: If the JSON file format is incorrect.
         """
+        size = os.path.getsize(self.file_path)
+        if ijson is not None and size >= STREAMING_THRESHOLD:
+            yield from self._stream()
+            return
+
         try:
-            with open(self.file_path, "r", encoding="utf-8") as file:
-                data = json.load(file)
-                for obj_data in data:
-                    yield obj_data
+            with open(self.file_path, "rb") as file:
+                if orjson is not None and size >= MMAP_THRESHOLD:
+                    data = self._load_mapped(file)
+                else:
+                    data = _loads(file.read())
+            for obj_data in data:
+                yield obj_data
         except json.JSONDecodeError as e:
             raise InvalidJsonFormatException(f"Failed to parse JSON file: {e}")
 
-    def save(self, data: List[Dict]) -> None:
+    @staticmethod
+    def _load_mapped(file: BinaryIO) -> Any:
+        """
+        Parses a memory-mapped file with `orjson`.
+
+        :param file: A non-empty file opened for reading in binary mode.
+        :return: The parsed object.
+        :raises json.JSONDecodeError: If the document is not valid JSON.
+        """
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+    def _stream(self) -> Generator[Dict, Any, None]:
+        """
+        Parses the JSON array incrementally with `ijson`.
+
+        :return: A generator that yields data as dictionaries.
+        :raises InvalidJsonFormatException: If the JSON file format is incorrect.
+        """
+        try:
+            with open(self.file_path, "rb") as file:
+                yield from ijson.items(file, "item", use_float=True)
+        except ijson.JSONError as e:
+            raise InvalidJsonFormatException(f"Failed to parse JSON file: {e}")
+
+    def save(self, data: Iterable[Dict]) -> None:
         """
         Saves data to a JSON file.
 
-        :param data: A list of dictionaries to save to the file.
+        The data is written to a temporary file, synced to disk
+        and then atomically replaces the target,
+        so a failed save never leaves a truncated file.
+
+        :param data: An iterable of dictionaries to save to the file.
+        :return: None
+        """
+        # A unique temporary file, so concurrent saves do not clobber it
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(self.file_path) or ".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb", buffering=WRITE_BUFFER_SIZE) as file:
+                self._write(file, data)
+                # Make sure the data is on disk before it replaces the file
+                file.flush()
+                os.fsync(file.fileno())
+            self._copy_mode(tmp_path)
+            os.replace(tmp_path, self.file_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def _copy_mode(self, tmp_path: str) -> None:
+        """
+        Gives the temporary file the permissions of the JSON file.
+
+        `tempfile.mkstemp` creates files readable only by their owner,
+        which would otherwise replace the permissions of the JSON file.
+
+        :param tmp_path: Path to the temporary file.
+        :return: None
+        """
+        try:
+            mode = stat.S_IMODE(os.stat(self.file_path).st_mode)
+        except FileNotFoundError:
+            return
+        os.chmod(tmp_path, mode)
+
+    def _write(self, file: BinaryIO, data: Iterable[Dict]) -> None:
+        """
+        Writes data to an open binary file as a JSON array.
+
+        Compact JSON is encoded one dictionary at a time,
+        so the whole document is never built in memory.
+
+        :param file: File opened for writing in binary mode.
+        :param data: An iterable of dictionaries to write.
         :return: None
         """
-        with open(self.file_path, "w", encoding="utf-8") as file:
-            json.dump(
-                data,
-                file,
-                ensure_ascii=False,
-                indent=4
-            )
+        if self.pretty:
+            file.write(_dumps(list(data), indent=True))
+            return
+
+        file.write(b"[")
+        for i, obj_data in enumerate(data):
+            if i:
+                file.write(b",")
+            file.write(_dumps(obj_data))
+        file.write(b"]")
 
     def _ensure_file_exists(self) -> None:
         """
@@ -56,7 +209,9 @@ class JsonSource(DataSource):
 
         :return: None
         """
-        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
-        if not os.path.exists(self.file_path):
-            with open(self.file_path, "w", encoding="utf-8") as file:
-                json.dump([], file)
+        os.makedirs(os.path.dirname(self.file_path) or ".", exist_ok=True)
+        try:
+            with open(self.file_path, "xb") as file:
+                file.write(b"[]")
+        except FileExistsError:
+            pass
@@ -0,0 +1,86 @@
+from typing import Iterable, List, Optional
+
+from models.book import Book
+from storage.base.manager import StorageManager
+from storage.sqlite.source import SqliteSource
+
+
+class SqliteBookStorageManager(StorageManager):
+    """
+    A class for working with books stored in an SQLite database.
+
+    Implements the `StorageManager` interface on top of `SqliteSource`.
+    Unlike the JSON storage, books are not kept in memory:
+    every operation is a single query, so changing one book
+    does not rewrite the whole storage.
+    """
+
+    def __init__(self, data_source: SqliteSource):
+        """
+        Initializes the book storage.
+
+        :param data_source: The SQLite data source used to store books.
+        """
+        self.data_source = data_source
+
+    def _load_objs(self) -> List[Book]:
+        """
+        Loads books from the data source.
+
+        :return: A list of Book objects loaded from the data source.
+        """
+        return [Book.from_json(data) for data in self.data_source.load()]
+
+    def save(self, book: Book) -> None:
+        """
+        Save or update book information.
+
+        :param book: Book object to save.
+        """
+        self.data_source.upsert(book.to_json())
+
+    def save_many(self, books: Iterable[Book]) -> None:
+        """
+        Save or update several books in a single transaction.
+
+        :param books: Book objects to save.
+        """
+        self.data_source.upsert_many(book.to_json() for book in books)
+
+    def get(self, book_id: str) -> Optional[Book]:
+        """
+        Get a book by its ID.
+
+        :param book_id: Unique identifier of the book.
+        :return: Found book object or None.
+        """
+        data = self.data_source.get(book_id)
+        return Book.from_json(data) if data else None
+
+    def delete(self, book: Book) -> None:
+        """
+        Remove a book from storage.
+
+        :param book: The book object to delete.
+        """
+        self.data_source.delete(book.id)
+
+    def find(self, query: Optional[str]) -> List[Book]:
+        """
+        Find books based on a given query.
+
+        :param query: Search string. Compares with title, author and year.
+        :return: List of book objects matching the request.
+        """
+        if query:
+            return [Book.from_json(data)
+                    for data in self.data_source.find(query.lower())]
+        return self.all()
+
+    def all(self) -> List[Book]:
+        """
+        Get a list of all books.
+
+        :return: List of book objects.
+        """
+        return self._load_objs()
@@ -0,0 +1,170 @@
+import os
+import sqlite3
+from typing import Any, Dict, Generator, Iterable, Optional
+
+from storage.base.source import DataSource
+
+# Columns of the books table in the order they are selected
+COLUMNS = ("id", "title", "author", "year", "status")
+
+_SELECT = f"SELECT {', '.join(COLUMNS)} FROM books"
+
+# Inserts a record or updates the existing one with the same ID
+_UPSERT = ("INSERT INTO books (id, title, author, year, status) "
+           "VALUES (:id, :title, :author, :year, :status) "
+           "ON CONFLICT (id) DO UPDATE SET title = excluded.title, "
+           "author = excluded.author, year = excluded.year, "
+           "status = excluded.status")
+
+# The largest value an SQLite INTEGER column can hold
+_MAX_INTEGER = 2 ** 63 - 1
+
+# Digits in _MAX_INTEGER, longer numbers are not converted at all
+_MAX_INTEGER_DIGITS = len(str(_MAX_INTEGER))
+
+
+class SqliteSource(DataSource):
+    """
+    Implementation of DataSource for working with an SQLite database.
+
+    Besides loading and saving all records at once, this source provides
+    queries for single records, so that changing one book does not require
+    rewriting the whole storage.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Opens (and creates if needed) the database with the books table.
+
+        :param file_path: Path to the SQLite database file.
+        """
+        self.file_path = file_path
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(file_path)
+        self.connection.row_factory = sqlite3.Row
+        # SQLite only lowercases ASCII, titles and authors may be Cyrillic
+        self.connection.create_function("py_lower", 1, str.lower,
+                                        deterministic=True)
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        """
+        Enables WAL mode and creates the books table.
+
+        Only the year is indexed: titles and authors are searched
+        by substring, which cannot use an index.
+
+        :return: None
+        """
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        with self.connection:
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS books (
+                    id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    author TEXT NOT NULL,
+                    year INTEGER NOT NULL,
+                    status TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS books_year ON books (year);
+            """)
+
+    def load(self) -> Generator[Dict, Any, None]:
+        """
+        Loads all records in the order they were added.
+
+        :return: A generator that yields records as dictionaries.
+        """
+        for row in self.connection.execute(f"{_SELECT} ORDER BY rowid"):
+            yield dict(row)
+
+    def save(self, data: Iterable[Dict]) -> None:
+        """
+        Replaces all records with the given ones in a single transaction.
+
+        :param data: An iterable of dictionaries to save.
+        :return: None
+        """
+        with self.connection:
+            self.connection.execute("DELETE FROM books")
+            self.connection.executemany(
+                "INSERT INTO books (id, title, author, year, status) "
+                "VALUES (:id, :title, :author, :year, :status)",
+                data
+            )
+
+    def get(self, record_id: str) -> Optional[Dict]:
+        """
+        Loads a single record by its ID.
+
+        :param record_id: Unique identifier of the record.
+        :return: The record as a dictionary, or None if it does not exist.
+        """
+        row = self.connection.execute(
+            f"{_SELECT} WHERE id = ?", (record_id,)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def upsert(self, record: Dict) -> None:
+        """
+        Inserts a record or updates the existing one with the same ID.
+
+        The record keeps its position in the table on update.
+
+        :param record: The record to save.
+        :return: None
+        """
+        with self.connection:
+            self.connection.execute(_UPSERT, record)
+
+    def upsert_many(self, records: Iterable[Dict]) -> None:
+        """
+        Inserts or updates several records in a single transaction.
+
+        :param records: The records to save.
+        :return: None
+        """
+        with self.connection:
+            self.connection.executemany(_UPSERT, records)
+
+    def delete(self, record_id: str) -> None:
+        """
+        Deletes a record by its ID.
+
+        :param record_id: Unique identifier of the record.
+        :return: None
+        """
+        with self.connection:
+            self.connection.execute("DELETE FROM books WHERE id = ?",
+                                    (record_id,))
+
+    def find(self, query: str) -> Generator[Dict, Any, None]:
+        """
+        Finds records whose title or author contains the query,
+        or whose year equals it if the query consists of digits.
+
+        :param query: Lowercase search string.
+        :return: A generator that yields matching records as dictionaries.
+        """
+        condition = ("instr(py_lower(title), :query) "
+                     "OR instr(py_lower(author), :query)")
+        params = {"query": query}
+        # Numbers that do not fit an SQLite INTEGER cannot match any year
+        if (query.isascii() and query.isdigit()
+                and len(query) <= _MAX_INTEGER_DIGITS
+                and int(query) <= _MAX_INTEGER):
+            condition += " OR year = :year"
+            params["year"] = int(query)
+        rows = self.connection.execute(
+            f"{_SELECT} WHERE {condition} ORDER BY rowid", params
+        )
+        for row in rows:
+            yield dict(row)
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+
+        :return: None
+        """
+        self.connection.close()
@@ -1,19 +1,35 @@
 import os
 import unittest
-from io import StringIO
+from io import BytesIO, StringIO, TextIOWrapper
+from pathlib import Path
 from unittest.mock import patch
 
+from cli.decorators import _SMALL_HISTORY_SIZE, _load_history
 from cli.parser import CLIParser
 from manager.manage import BookManager
 from models.book import Book
 from models.constants import BookStatus
 from storage.json.manager import BookStorageManager
 from storage.json.source import JsonSource
+from tests.utils import make_data_dir
+
+try:
+    import readline
+except ImportError:
+    readline = None
 
 
 class TestCLIParser(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """
+        Performed once before the tests.
+        Creates a directory for the data file.
+        """
+        cls.data_dir = make_data_dir(cls)
+
     def setUp(self):
-        self.test_file_path = 'data/books.json'
+        self.test_file_path = os.path.join(self.data_dir, "books.json")
         self.book_source = JsonSource(self.test_file_path)
         self.book_storage = BookStorageManager(self.book_source)
         self.book_manager = BookManager(self.book_storage)
@@ -24,8 +40,7 @@ class TestCLIParser(unittest.TestCase):
         Performed after each test.
         Clears the data file in preparation for the next test.
         """
-        if os.path.exists(self.test_file_path):
-            os.remove(self.test_file_path)
+        Path(self.test_file_path).unlink(missing_ok=True)
 
     @patch("sys.stdout", new_callable=StringIO)
     def test_add_book(self, mock_stdout):
@@ -66,6 +81,38 @@ class TestCLIParser(unittest.TestCase):
             if "|" in line and not line.startswith("ID"):
                 self.assertRegex(line, r"^[a-f0-9\-]{36}\s+\|")
 
+    def test_show_all_redirected_output_errors(self):
+        """
+        Checks that redirected output is encoded with the error handler
+        of stdout, as a regular text write would be.
+        """
+        self.book_manager.add_book(
+            Book(title="1984", author="George Orwell", year=1949))
+
+        # A redirected stdout that cannot encode the Cyrillic status
+        buffer = BytesIO()
+        stdout = TextIOWrapper(buffer, encoding="ascii", errors="replace")
+        with patch("sys.stdout", stdout):
+            self.cli_parser.execute_command("show-all")
+
+        output = buffer.getvalue().decode("ascii")
+        self.assertRegex(output, r"1984\s+\|\s+George Orwell\s+\|\s+"
+                                 r"1949\s+\|\s+\? \?+")
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_simple_command_skips_argparse(self, mock_stdout):
+        """
+        Checks that simple commands are executed without building
+        the argparse parser, while other commands still build it.
+        """
+        self.cli_parser.execute_command("show-all")
+        self.assertNotIn("parser", vars(self.cli_parser))
+
+        self.cli_parser.execute_command("add-book '1984' 'George Orwell' 1949")
+        self.assertIn("parser", vars(self.cli_parser))
+        self.assertIn("Book '1984' added successfully.",
+                      mock_stdout.getvalue())
+
     @patch("sys.stdout", new_callable=StringIO)
     def test_find_books(self, mock_stdout):
 
@@ -139,6 +186,27 @@ class TestCLIParser(unittest.TestCase):
         # Checking that the output contains error description
         self.assertIn("add-book: error: argument ", error_message)
 
+    @patch("sys.stderr", new_callable=StringIO)
+    def test_update_status_invalid_choice(self, mock_stderr):
+        """
+        Test for updating the status of a book with an invalid value.
+        """
+        # Adding a book
+        book = Book(title="1984", author="George Orwell", year=1949)
+        self.book_manager.add_book(book)
+
+        # Command with a status that is not among the choices
+        command_input = f"update-status {book.id} утрачена"
+
+        # Executing a command
+        self.cli_parser.execute_command(command_input)
+
+        # Checking that argparse reported the error and status is unchanged
+        self.assertIn("argument status: invalid choice:",
+                      mock_stderr.getvalue())
+        self.assertEqual(self.book_manager.all()[0].status,
+                         BookStatus.AVAILABLE.value)
+
     @patch("sys.stderr", new_callable=StringIO)
     def test_invalid_command(self, mock_stderr):
         """
@@ -176,5 +244,57 @@ class TestCLIParser(unittest.TestCase):
         self.assertIn("Use 'help' for a list of commands.", error_message)
 
 
+
+@unittest.skipUnless(readline and "libedit" not in (readline.__doc__ or ""),
+                     "GNU readline is not available")
+class TestLoadHistory(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """
+        Performed once before the tests.
+        Creates a directory for the history file.
+        """
+        cls.data_dir = make_data_dir(cls)
+
+    def setUp(self):
+        """
+        Performed before each test.
+        Starts with an empty history and restores it afterwards.
+        """
+        saved = [readline.get_history_item(i)
+                 for i in range(1, readline.get_current_history_length() + 1)]
+        readline.clear_history()
+        self.addCleanup(self._restore_history, saved)
+
+    @staticmethod
+    def _restore_history(entries):
+        """
+        Replaces the readline history with the given entries.
+
+        :param entries: History entries to restore.
+        """
+        readline.clear_history()
+        for entry in entries:
+            readline.add_history(entry)
+
+    def test_load_tail_of_large_file(self):
+        """
+        Checks that only the last entries of a large history file
+        are loaded, decoding invalid UTF-8 with replacement characters.
+        """
+        file = os.path.join(self.data_dir, "history")
+        lines = [f"show-all {i}".encode() for i in range(1000)]
+        lines[-1] += b" \xff"  # Invalid UTF-8
+        with open(file, "wb") as f:
+            f.write(b"\n".join(lines) + b"\n")
+        self.assertGreaterEqual(os.path.getsize(file), _SMALL_HISTORY_SIZE)
+
+        _load_history(file, 10)
+
+        self.assertEqual(readline.get_current_history_length(), 10)
+        self.assertEqual(readline.get_history_item(1), "show-all 990")
+        self.assertEqual(readline.get_history_item(10),
+                         "show-all 999 \ufffd")
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,12 +1,11 @@
-import os
 import unittest
+from dataclasses import replace
 
 from manager.manage import BookManager
-from models.book import Book
 from models.constants import BookStatus
 from models.exceptions import BookNotFoundException, ValidationException
 from storage.json.manager import BookStorageManager
-from storage.json.source import JsonSource
+from tests.utils import TEMPLATE_BOOK, InMemorySource
 
 
 class TestBookManager(unittest.TestCase):
@@ -14,40 +13,30 @@ class TestBookManager(unittest.TestCase):
     def setUp(self):
         """
         Performed before each test.
-        A temporary storage for tests is created.
+        Creates a storage on top of an in-memory data source.
         """
-        # The path to the test file
-        self.test_file_path = "data/test_books.json"
-
-        # Create temporary storage for tests
-        self.source = JsonSource(self.test_file_path)
+        self.source = InMemorySource()
         self.storage = BookStorageManager(self.source)
         self.book_manager = BookManager(self.storage)
 
-    def tearDown(self):
-        """
-        Performed after each test.
-        Clears the data file in preparation for the next test.
-        """
-        if os.path.exists(self.test_file_path):
-            os.remove(self.test_file_path)
-
     def test_add_book(self):
         """
         Checks whether a book has been added to the repository.
         """
-        book = Book(title="Test Book", author="Author", year=2024)
+        book = replace(TEMPLATE_BOOK)
         self.book_manager.add_book(book)
         books = self.book_manager.all()
         self.assertEqual(len(books), 1)
-        self.assertEqual(books[0].title, book.title)
+        self.assertEqual(books[0].as_tuple(),
+                         ("Test Book", "Author", 2024,
+                          BookStatus.AVAILABLE.value))
         self.assertTrue(books[0].id)
 
     def test_remove_book(self):
         """
         Checks book deletion by ID.
         """
-        book = Book(title="Test Book", author="Author", year=2024)
+        book = replace(TEMPLATE_BOOK)
         self.book_manager.add_book(book)
         self.book_manager.remove_book(book.id)
         books = self.book_manager.all()
@@ -57,7 +46,7 @@ class TestBookManager(unittest.TestCase):
         """
         Checks the search for a book by part of the title.
         """
-        book = Book(title="Test Book", author="Author", year=2024)
+        book = replace(TEMPLATE_BOOK)
         self.book_manager.add_book(book)
         books = self.book_manager.find_books("Test")
         self.assertEqual(len(books), 1)
@@ -67,7 +56,7 @@ class TestBookManager(unittest.TestCase):
         """
         Checks for changes in book status.
         """
-        book = Book(title="Test Book", author="Author", year=2024)
+        book = replace(TEMPLATE_BOOK)
         self.book_manager.add_book(book)
         self.book_manager.update_status(book.id, BookStatus.ISSUED.value)
         updated_book = self.book_manager.all()[0]
@@ -98,7 +87,7 @@ class TestBookManager(unittest.TestCase):
         Checks that an exception will be thrown
         if we try to set an invalid status.
         """
-        book = Book(title="Test Book", author="Author", year=2024)
+        book = replace(TEMPLATE_BOOK)
         self.book_manager.add_book(book)
         with self.assertRaises(ValidationException):
             self.book_manager.update_status(book.id, "утрачена")  # Invalid status
@@ -1,10 +1,20 @@
 import os
 import unittest
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import ANY, Mock, patch
 
 from models.book import Book
+from models.constants import BookStatus
 from storage.json.exceptions import InvalidJsonFormatException
 from storage.json.manager import BookStorageManager
-from storage.json.source import JsonSource
+from storage.json.source import JsonSource, ijson, orjson
+from storage.sqlite.manager import SqliteBookStorageManager
+from storage.sqlite.source import SqliteSource
+from tests.utils import TEMPLATE_BOOK, InMemorySource, make_data_dir
+
+# Contents of an empty data file
+EMPTY_JSON = b"[]"
 
 
 class TestStorageManager(unittest.TestCase):
@@ -12,56 +22,57 @@ class TestStorageManager(unittest.TestCase):
     def setUp(self):
         """
         Performed before each test.
-        We create a test storage with a temporary file.
+        We create a test storage on top of an in-memory source.
         """
-        self.test_file_path = "data/test_books.json"
-        self.source = JsonSource(file_path=self.test_file_path)
+        self.source = InMemorySource()
         self.storage = BookStorageManager(self.source)
 
-    def tearDown(self):
-        """
-        Performed after each test.
-        Clears the data file in preparation for the next test.
-        """
-        if os.path.exists(self.test_file_path):
-            os.remove(self.test_file_path)
-
-    def test_create_storage(self):
-        """
-        Verifies that when a JsonSource object is created, a file is created.
-        """
-        self.assertTrue(os.path.exists(self.test_file_path))
-
     def test_add_book_to_storage(self):
         """
         Checks whether a book has been added to the storage.
         """
-        book = Book(title="Test Book", author="Author", year=2024)
+        book = replace(TEMPLATE_BOOK)
         self.storage.save(book)
 
         # Checking that the book has been added
         books = self.storage.all()
         self.assertEqual(len(books), 1)
-        self.assertEqual(books[0].title, "Test Book")
+        self.assertEqual(books[0].as_tuple(),
+                         ("Test Book", "Author", 2024,
+                          BookStatus.AVAILABLE.value))
         self.assertTrue(books[0].id)
 
     def test_get_all_books_empty(self):
         """
         Checks that the all method returns an empty list if the file is empty.
         """
-        books = self.storage.all()
+        books = BookStorageManager(self.source).all()
         self.assertEqual(len(books), 0)
 
+    def test_all_returns_copy(self):
+        """
+        Checks that changing the list returned by `all` and `find`
+        does not change the storage.
+        """
+        book = replace(TEMPLATE_BOOK)
+        self.storage.save(book)
+
+        self.storage.all().clear()
+        self.storage.find(None).clear()
+        self.assertEqual(self.storage.all(), [book])
+
     def test_get_book_by_id(self):
         """
         Checks that the book can be found by ID.
         """
-        book = Book(title="Test Book", author="Author", year=2024)
+        book = replace(TEMPLATE_BOOK)
         self.storage.save(book)
 
         # Check that the book is found by ID
         retrieved_book = self.storage.get(book.id)
-        self.assertEqual(retrieved_book.title, "Test Book")
+        self.assertEqual(retrieved_book.as_tuple(),
+                         ("Test Book", "Author", 2024,
+                          BookStatus.AVAILABLE.value))
 
     def test_get_book_by_non_existing_id(self):
         """
@@ -77,12 +88,11 @@ class TestStorageManager(unittest.TestCase):
         """
         Checks the deletion of a book from storage and checks for file changes.
         """
-        book = Book(title="Test Book", author="Author", year=2024)
+        book = replace(TEMPLATE_BOOK)
         self.storage.save(book)
 
         # Checking that the book has been added
-        storage_after_save = BookStorageManager(self.source)
-        books_after_save = storage_after_save.all()
+        books_after_save = self.storage.all()
 
         self.assertEqual(len(books_after_save), 1)
         self.assertEqual(books_after_save[0].title, "Test Book")
@@ -90,7 +100,7 @@ class TestStorageManager(unittest.TestCase):
         # Deleting a book
         self.storage.delete(book)
 
-        # Create a new JsonSource object
+        # Reopen the storage over the same source
         # and check that the book has been deleted
         storage_after_delete = BookStorageManager(self.source)
         books_after_delete = storage_after_delete.all()
@@ -101,7 +111,7 @@ class TestStorageManager(unittest.TestCase):
         """
         Checks whether the Book data is updated in the storage.
         """
-        book = Book(title="Test Book", author="Author", year=2024)
+        book = replace(TEMPLATE_BOOK)
         self.storage.save(book)
 
         # Updating information about the book
@@ -112,6 +122,153 @@ class TestStorageManager(unittest.TestCase):
         updated_book = self.storage.get(book.id)
         self.assertEqual(updated_book.title, "Updated Book")
 
+        # Checking that the update has been written to the file
+        stored_book = BookStorageManager(self.source).get(book.id)
+        self.assertEqual(stored_book.as_tuple(), book.as_tuple())
+
+    def test_find_books_by_substring(self):
+        """
+        Checks that books are found by a part of the title or author,
+        both for long and short queries.
+        """
+        book1 = Book(title="Brave New World", author="Aldous Huxley",
+                     year=1932)
+        book2 = Book(title="New Grub Street", author="George Gissing",
+                     year=1891)
+        self.storage.save_many([book1, book2])
+
+        self.assertEqual(self.storage.find("HUXLEY"), [book1])
+        self.assertEqual(self.storage.find("new "), [book1, book2])
+        self.assertEqual(self.storage.find("ge"), [book2])
+        self.assertEqual(self.storage.find("missing"), [])
+
+    def test_find_books_by_year(self):
+        """
+        Checks that a number matches the exact year of publication
+        as well as titles containing it.
+        """
+        book1 = Book(title="1984", author="George Orwell", year=1949)
+        book2 = Book(title="Animal Farm", author="George Orwell", year=1945)
+        book3 = Book(title="Brave New World", author="Aldous Huxley",
+                     year=1932)
+        self.storage.save_many([book1, book2, book3])
+
+        self.assertEqual(self.storage.find("1945"), [book2])
+        self.assertEqual(self.storage.find("1984"), [book1])
+        self.assertEqual(self.storage.find("19"), [book1])
+        # Non-ASCII digits and huge numbers are only matched as substrings
+        self.assertEqual(self.storage.find("²"), [])
+        self.assertEqual(self.storage.find("12345678901234567890"), [])
+        self.assertEqual(self.storage.find("1" * 5000), [])
+
+    def test_find_after_update_and_delete(self):
+        """
+        Checks that search results follow updated and deleted books.
+        """
+        book = replace(TEMPLATE_BOOK)
+        self.storage.save(book)
+
+        book.title = "Updated Book"
+        self.storage.save(book)
+        self.assertEqual(self.storage.find("updated"), [book])
+        self.assertEqual(self.storage.find("test"), [])
+
+        self.storage.delete(book)
+        self.assertEqual(self.storage.find("updated"), [])
+
+    def test_unchanged_save_skips_write(self):
+        """
+        Checks that saving a book without changes does not write the data.
+        """
+        book = replace(TEMPLATE_BOOK)
+        self.storage.save(book)
+
+        # Replace the stored data behind the storage's back
+        self.source.buffer = bytearray(EMPTY_JSON)
+
+        self.storage.save(book)
+        self.assertEqual(self.source.buffer, EMPTY_JSON)
+
+    def test_batch_saves_once(self):
+        """
+        Checks that changes made in a batch are written to the file
+        only when the batch ends.
+        """
+        book1 = replace(TEMPLATE_BOOK, title="Test Book 1",
+                        author="Author 1")
+        book2 = replace(TEMPLATE_BOOK, title="Test Book 2",
+                        author="Author 2")
+
+        with self.storage.batch():
+            self.storage.save(book1)
+            self.storage.save(book2)
+            self.storage.save(book1)
+
+            # Books are available, but nothing is written yet
+            self.assertEqual(self.storage.get(book2.id), book2)
+            self.assertEqual(len(BookStorageManager(self.source).all()), 0)
+
+        books = BookStorageManager(self.source).all()
+        self.assertEqual([book.id for book in books], [book1.id, book2.id])
+        self.assertEqual(self.storage.find("Book 2"), [book2])
+
+    def test_overwrite_file(self):
+        """
+        Checks that when new data is added, the file is actually overwritten.
+        """
+        # Create the first book and save it
+        book1 = replace(TEMPLATE_BOOK, title="Test Book 1",
+                        author="Author 1")
+        self.storage.save(book1)
+
+        # Check the books after the first save
+        books_after_first_save = self.storage.all()
+        self.assertEqual(len(books_after_first_save), 1)
+        self.assertEqual(books_after_first_save[0].title, "Test Book 1")
+
+        # Add two more books with a single save
+        book2 = replace(TEMPLATE_BOOK, title="Test Book 2",
+                        author="Author 2")
+        book3 = replace(TEMPLATE_BOOK, title="Test Book 3",
+                        author="Author 3")
+        self.storage.save_many([book2, book3])
+
+        # Reopen the storage over the same source
+        # and check that the data is overwritten correctly
+        storage_after_second_save = BookStorageManager(self.source)
+        books_after_second_save = storage_after_second_save.all()
+        self.assertEqual([book.title for book in books_after_second_save],
+                         ["Test Book 1", "Test Book 2", "Test Book 3"])
+
+
+class TestJsonSource(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Performed once before the tests.
+        We create a test data source with a temporary file.
+        """
+        cls.data_dir = make_data_dir(cls)
+        cls.test_file_path = os.path.join(cls.data_dir, "test_books.json")
+        cls.source = JsonSource(file_path=cls.test_file_path)
+
+    def setUp(self):
+        """
+        Performed before each test.
+        Empties the data file.
+        """
+        with open(self.test_file_path, "wb") as f:
+            f.write(EMPTY_JSON)
+
+    def test_create_storage(self):
+        """
+        Verifies that when a JsonSource object is created, a file is created.
+        """
+        os.remove(self.test_file_path)
+        JsonSource(file_path=self.test_file_path)
+        self.assertTrue(os.path.exists(self.test_file_path))
+
     def test_empty_file(self):
         """
         Checks correct operation with an empty file.
@@ -120,7 +277,7 @@ class TestStorageManager(unittest.TestCase):
         with open(self.test_file_path, 'w') as f:
             f.write('[]')
 
-        books = self.storage.all()
+        books = BookStorageManager(self.source).all()
         self.assertEqual(len(books), 0)
 
     def test_invalid_json_format(self):
@@ -134,31 +291,193 @@ class TestStorageManager(unittest.TestCase):
         with self.assertRaises(InvalidJsonFormatException):
             BookStorageManager(self.source)
 
-    def test_overwrite_file(self):
+    def test_save_and_reload(self):
         """
-        Checks that when new data is added, the file is actually overwritten.
+        Checks that books saved to the file are loaded back unchanged,
+        both in compact and in indented JSON.
         """
-        # Create the first book and save it
-        book1 = Book(title="Test Book 1", author="Author 1", year=2024)
+        for pretty in (False, True):
+            with self.subTest(pretty=pretty):
+                with open(self.test_file_path, "wb") as f:
+                    f.write(EMPTY_JSON)
+                source = JsonSource(self.test_file_path, pretty=pretty)
+                books = [replace(TEMPLATE_BOOK, title="Test Book 1"),
+                         replace(TEMPLATE_BOOK, title="Test Book 2",
+                                 status=BookStatus.ISSUED.value)]
+                BookStorageManager(source).save_many(books)
+
+                reloaded = BookStorageManager(
+                    JsonSource(self.test_file_path)).all()
+                self.assertEqual(reloaded, books)
+
+    def _check_load(self):
+        """
+        Checks that books saved to the file are loaded back,
+        and that a corrupted file throws an error.
+        """
+        book = replace(TEMPLATE_BOOK)
+        BookStorageManager(self.source).save(book)
+        self.assertEqual(BookStorageManager(self.source).all(), [book])
+
+        with open(self.test_file_path, "w") as f:
+            f.write('{"title": 123')  # Invalid JSON format
+
+        with self.assertRaises(InvalidJsonFormatException):
+            BookStorageManager(self.source)
+
+    @unittest.skipUnless(orjson, "orjson is not installed")
+    @patch("storage.json.source.MMAP_THRESHOLD", 0)
+    def test_load_memory_mapped(self):
+        """
+        Checks loading a memory-mapped file with orjson.
+        """
+        self._check_load()
+
+    @unittest.skipUnless(ijson, "ijson is not installed")
+    @patch("storage.json.source.STREAMING_THRESHOLD", 0)
+    def test_load_streamed(self):
+        """
+        Checks loading a file incrementally with ijson.
+        Needs ijson to be installed, `test_stream_with_stub` covers
+        the handling of its results and errors without it.
+        """
+        self._check_load()
+
+    @patch("storage.json.source.STREAMING_THRESHOLD", 0)
+    def test_stream_with_stub(self):
+        """
+        Checks that streamed items are loaded as books, that ijson is
+        asked for floats instead of decimals, and that its parse errors
+        are turned into InvalidJsonFormatException.
+        """
+        class JSONError(Exception):
+            pass
+
+        book = replace(TEMPLATE_BOOK)
+        stub = Mock(JSONError=JSONError)
+        stub.items.return_value = iter([book.to_json()])
+        with patch("storage.json.source.ijson", stub):
+            self.assertEqual(BookStorageManager(self.source).all(), [book])
+            stub.items.assert_called_once_with(ANY, "item", use_float=True)
+
+            stub.items.side_effect = JSONError("Invalid JSON")
+            with self.assertRaises(InvalidJsonFormatException):
+                BookStorageManager(self.source)
+
+    def test_failed_save_keeps_file(self):
+        """
+        Checks that a failed save leaves the original file intact
+        and removes its temporary file.
+        """
+        with self.assertRaises(TypeError):
+            self.source.save([{"id": "12345", "title": object()}])
+
+        with open(self.test_file_path, "rb") as f:
+            self.assertEqual(f.read(), EMPTY_JSON)
+        self.assertFalse([name for name in os.listdir(self.data_dir)
+                          if name.endswith(".tmp")])
+
+
+class TestSqliteStorageManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Performed once before the tests.
+        Creates a directory for the test databases.
+        """
+        cls.data_dir = make_data_dir(cls)
+
+    def setUp(self):
+        """
+        Performed before each test.
+        We create a test storage with a temporary database.
+        """
+        self.test_file_path = os.path.join(self.data_dir,
+                                           "test_books.sqlite3")
+        self.source = SqliteSource(file_path=self.test_file_path)
+        self.storage = SqliteBookStorageManager(self.source)
+
+    def tearDown(self):
+        """
+        Performed after each test.
+        Closes the database and removes its files.
+        """
+        self.source.close()
+        for suffix in ("", "-wal", "-shm"):
+            Path(self.test_file_path + suffix).unlink(missing_ok=True)
+
+    def test_save_and_get(self):
+        """
+        Checks that a saved book can be retrieved by ID.
+        """
+        book = replace(TEMPLATE_BOOK)
+        self.storage.save(book)
+
+        self.assertEqual(self.storage.get(book.id), book)
+        self.assertIsNone(
+            self.storage.get("3bb236a3-5de3-467a-8502-7b4510d30c51"))
+
+    def test_save_many(self):
+        """
+        Checks that several books are inserted and updated at once,
+        keeping their order.
+        """
+        book1 = replace(TEMPLATE_BOOK, title="Test Book 1")
+        book2 = replace(TEMPLATE_BOOK, title="Test Book 2")
+        self.storage.save_many([book1, book2])
+
+        book1.title = "Updated Book"
+        book3 = replace(TEMPLATE_BOOK, title="Test Book 3")
+        self.storage.save_many([book1, book3])
+
+        self.assertEqual(self.storage.all(), [book1, book2, book3])
+
+    def test_update_keeps_order(self):
+        """
+        Checks that updating a book changes its data but not its position.
+        """
+        book1 = replace(TEMPLATE_BOOK, title="Test Book 1",
+                        author="Author 1")
+        book2 = replace(TEMPLATE_BOOK, title="Test Book 2",
+                        author="Author 2")
         self.storage.save(book1)
+        self.storage.save(book2)
 
-        # Create a new JsonSource object and check the contents of the file
-        storage_after_first_save = BookStorageManager(self.source)
-        books_after_first_save = storage_after_first_save.all()
-        self.assertEqual(len(books_after_first_save), 1)
-        self.assertEqual(books_after_first_save[0].title, "Test Book 1")
+        book1.title = "Updated Book"
+        self.storage.save(book1)
+
+        reopened = SqliteBookStorageManager(
+            SqliteSource(self.test_file_path))
+        self.assertEqual(reopened.all(), [book1, book2])
+        reopened.data_source.close()
+
+    def test_delete(self):
+        """
+        Checks the deletion of a book from storage.
+        """
+        book = replace(TEMPLATE_BOOK)
+        self.storage.save(book)
+        self.storage.delete(book)
+        self.assertEqual(self.storage.all(), [])
 
-        # Add a second book and save it
-        book2 = Book(title="Test Book 2", author="Author 2", year=2024)
+    def test_find(self):
+        """
+        Checks the case-insensitive search by title, author and year.
+        """
+        book1 = Book(title="Сказка о рыбке", author="А.С.Пушкин", year=1835)
+        book2 = Book(title="1984", author="George Orwell", year=1949)
+        self.storage.save(book1)
         self.storage.save(book2)
 
-        # Create a new JsonSource object
-        # and check that the file is overwritten correctly
-        storage_after_second_save = BookStorageManager(self.source)
-        books_after_second_save = storage_after_second_save.all()
-        self.assertEqual(len(books_after_second_save), 2)
-        self.assertEqual(books_after_second_save[0].title, "Test Book 1")
-        self.assertEqual(books_after_second_save[1].title, "Test Book 2")
+        self.assertEqual(self.storage.find("СКАЗКА"), [book1])
+        self.assertEqual(self.storage.find("orwell"), [book2])
+        self.assertEqual(self.storage.find("1835"), [book1])
+        self.assertEqual(self.storage.find("18"), [])
+        self.assertEqual(self.storage.find("²"), [])
+        self.assertEqual(self.storage.find("12345678901234567890"), [])
+        self.assertEqual(self.storage.find("1" * 5000), [])
+        self.assertEqual(self.storage.find(None), [book1, book2])
 
 
 if __name__ == "__main__":
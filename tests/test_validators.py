@@ -5,6 +5,48 @@ from models.book import Book
 from models.constants import BookStatus
 from models.exceptions import ValidationException
 
+# The current year, computed once for the whole module
+CURRENT_YEAR = datetime.now().year
+
+# All valid status values, collected once for the whole module
+_STATUS_VALUES = tuple(status.value for status in BookStatus)
+
+# Keyword arguments of invalid books and the expected error messages
+INVALID_BOOKS = [
+    # Empty required field
+    (dict(title="", author="Valid Author", year=2023,
+          status=BookStatus.AVAILABLE.value),
+     "Fields cannot be empty: title"),
+    # Invalid data type for year
+    (dict(title="Valid Title", author="Valid Author", year="Not a Year",
+          status=BookStatus.AVAILABLE.value),
+     "Field 'year' must be of type int"),
+    # Blank author field
+    (dict(title="Valid Title", author="   ", year=2023,
+          status=BookStatus.AVAILABLE.value),
+     "Fields cannot be empty: author"),
+    # Year in the future
+    (dict(title="Valid Title", author="Valid Author",
+          year=CURRENT_YEAR + 1, status=BookStatus.AVAILABLE.value),
+     f"Year must be between 1 and {CURRENT_YEAR}"),
+    # Year is too small
+    (dict(title="Valid Title", author="Valid Author", year=0,
+          status=BookStatus.AVAILABLE.value),
+     "Year must be between 1 and"),
+]
+
+# Invalid book data for from_json and the expected error messages
+INVALID_BOOK_DATA = [
+    # The year field is omitted
+    ({"id": "12345", "title": "Valid Title", "author": "Valid Author",
+      "status": BookStatus.AVAILABLE.value},
+     "Field 'year' must be of type int"),
+    # The status field is omitted
+    ({"id": "12345", "title": "Valid Title", "author": "Valid Author",
+      "year": 2023},
+     "Fields cannot be empty: status"),
+]
+
 
 class TestBookValidator(unittest.TestCase):
     def test_valid_book(self):
@@ -19,129 +61,56 @@ class TestBookValidator(unittest.TestCase):
         )
         self.assertTrue(book.validate())
 
-    def test_missing_required_field_title(self):
+    def test_valid_statuses(self):
         """
-        Checks that the absence of a required field throws a ValidationException.
+        Checks that a book passes validation with every valid status.
         """
-        with self.assertRaises(ValidationException) as context:
-            book = Book(
-                title="",
-                author="Valid Author",
-                year=2023,
-                status=BookStatus.AVAILABLE.value
-            )
-            book.validate()
-        self.assertIn("Fields cannot be empty: title", str(context.exception))
+        for status in _STATUS_VALUES:
+            with self.subTest(status=status):
+                book = Book(title="Valid Title", author="Valid Author",
+                            year=2023, status=status)
+                self.assertTrue(book.validate())
 
-    def test_invalid_data_type_year(self):
+    def test_invalid_books(self):
         """
-        Checks that an invalid data type for year throws a ValidationException.
+        Checks that invalid Book objects throw a ValidationException
+        with the expected message.
         """
-        with self.assertRaises(ValidationException) as context:
-            book = Book(
-                title="Valid Title",
-                author="Valid Author",
-                year="Not a Year",  # Invalid type
-                status=BookStatus.AVAILABLE.value
-            )
-            book.validate()
-        self.assertIn("Field 'year' must be of type int",
-                      str(context.exception))
+        for kwargs, message in INVALID_BOOKS:
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValidationException) as context:
+                    Book(**kwargs).validate()
+                self.assertIn(message, str(context.exception))
 
-    def test_empty_author_field(self):
+    def test_invalid_book_data(self):
         """
-        Checks that an empty author field throws a ValidationException.
+        Checks that invalid book data loaded with from_json throws
+        a ValidationException with the expected message.
         """
-        with self.assertRaises(ValidationException) as context:
-            book = Book(
-                title="Valid Title",
-                author="   ",  # Empty string
-                year=2023,
-                status=BookStatus.AVAILABLE.value
-            )
-            book.validate()
-        self.assertIn("Fields cannot be empty: author", str(context.exception))
+        for book_data, message in INVALID_BOOK_DATA:
+            with self.subTest(**book_data):
+                with self.assertRaises(ValidationException) as context:
+                    Book.from_json(book_data).validate()
+                self.assertIn(message, str(context.exception))
 
     def test_invalid_status_choice(self):
         """
-        Checks that an invalid status value throws a ValidationException.
+        Checks that an invalid status value throws a ValidationException
+        with exactly the status error.
         """
+        book_data = {
+            "id": "12345",
+            "title": "Valid Title",
+            "author": "Valid Author",
+            "year": 2024,
+            "status": "утрачена"  # Invalid status
+        }
         with self.assertRaises(ValidationException) as context:
-            book_data = {
-                "id": "12345",
-                "title": "Valid Title",
-                "author": "Valid Author",
-                "year": 2024,
-                "status": "утрачена"  # Invalid status
-            }
-            book = Book.from_json(book_data)
-            book.validate()
+            Book.from_json(book_data).validate()
         self.assertEqual("Incorrect status: утрачена. "
                          "Valid values: ['в наличии', 'выдана']",
                          str(context.exception))
 
-    def test_invalid_year_future(self):
-        """
-        Checks that the year in the future throws a ValidationException.
-        """
-        future_year = datetime.now().year + 1
-        with self.assertRaises(ValidationException) as context:
-            book = Book(
-                title="Valid Title",
-                author="Valid Author",
-                year=future_year,  # Next year
-                status=BookStatus.AVAILABLE.value
-            )
-            book.validate()
-        self.assertIn(f"Year must be between 1 and {datetime.now().year}",
-                      str(context.exception))
-
-    def test_invalid_year_past(self):
-        """
-        Checks that the year is too small and throws a ValidationException.
-        """
-        with self.assertRaises(ValidationException) as context:
-            book = Book(
-                title="Valid Title",
-                author="Valid Author",
-                year=0,  # Too little year
-                status=BookStatus.AVAILABLE.value
-            )
-            book.validate()
-        self.assertIn("Year must be between 1 and", str(context.exception))
-
-    def test_missing_year(self):
-        """
-        Checks that a missing year causes a ValidationException.
-        """
-        with self.assertRaises(ValidationException) as context:
-            book_data = {
-                "id": "12345",
-                "title": "Valid Title",
-                "author": "Valid Author",
-                "status": BookStatus.AVAILABLE.value
-                # The year field is omitted
-            }
-            book = Book.from_json(book_data)
-            book.validate()
-        self.assertIn("Field 'year' must be of type int",
-                      str(context.exception))
-
-    def test_missing_status(self):
-        """
-        Checks that missing status causes a ValidationException.
-        """
-        with self.assertRaises(ValidationException) as context:
-            book_data = {
-                "id": "12345",
-                "title": "Valid Title",
-                "author": "Valid Author",
-                "year": 2023  # The status field is omitted
-            }
-            book = Book.from_json(book_data)
-            book.validate()
-        self.assertIn("Fields cannot be empty: status", str(context.exception))
-
 
 if __name__ == "__main__":
     unittest.main()
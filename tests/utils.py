@@ -0,0 +1,74 @@
+import io
+import json
+import tempfile
+from typing import Any, Dict, Generator, Iterable, Type
+from unittest import TestCase
+
+from models.book import Book
+from storage.json.exceptions import InvalidJsonFormatException
+from storage.json.source import JsonSource, _loads
+
+# A valid book for tests to copy with `dataclasses.replace`,
+# which also gives each copy a new ID
+TEMPLATE_BOOK = Book(title="Test Book", author="Author", year=2024)
+
+
+def make_data_dir(test_class: Type[TestCase]) -> str:
+    """
+    Creates a temporary directory for the test data files.
+
+    The directory is unique to the test process, so parallel test runs
+    do not clobber each other's files. It is removed after the tests
+    of the class have run.
+
+    :param test_class: The test class, usually from its `setUpClass`.
+    :return: Path to the directory.
+    """
+    data_dir = tempfile.TemporaryDirectory()
+    test_class.addClassCleanup(data_dir.cleanup)
+    return data_dir.name
+
+
+class InMemorySource(JsonSource):
+    """
+    A `JsonSource` that keeps the serialized JSON in memory.
+
+    It encodes and parses data exactly like `JsonSource`,
+    including the `orjson` fast path when it is installed,
+    but without touching the file system, so tests that do not check
+    on-disk behavior are not slowed down by file I/O.
+    """
+
+    def __init__(self, pretty: bool = False):
+        """
+        Initializes the source with an empty JSON array.
+
+        :param pretty: Whether to write indented JSON.
+        """
+        self.file_path = None
+        self.pretty = pretty
+        self.buffer = bytearray(b"[]")
+
+    def load(self) -> Generator[Dict, Any, None]:
+        """
+        Loads data from the in-memory buffer as a generator.
+
+        :return: A generator that yields data as dictionaries.
+        :raises InvalidJsonFormatException: If the JSON format is incorrect.
+        """
+        try:
+            data = _loads(self.buffer)
+        except json.JSONDecodeError as e:
+            raise InvalidJsonFormatException(f"Failed to parse JSON file: {e}")
+        yield from data
+
+    def save(self, data: Iterable[Dict]) -> None:
+        """
+        Saves data to the in-memory buffer.
+
+        :param data: An iterable of dictionaries to save.
+        :return: None
+        """
+        file = io.BytesIO()
+        self._write(file, data)
+        self.buffer = bytearray(file.getvalue())